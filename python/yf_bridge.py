@@ -1,21 +1,35 @@
 #!/usr/bin/env python3
+import hashlib
 import json
+import os
 import sys
+import tempfile
+import threading
+import time
 import traceback
-from typing import Any, Dict, List, Optional, cast
-import math
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial, singledispatch
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, cast
 
 try:
     import numpy as np
+    import orjson
     import pandas as pd
     import yfinance as yf
     _IMPORT_ERROR = None
 except Exception as exc:  # pragma: no cover - import guard
     np = cast(Any, None)
+    orjson = cast(Any, None)
     pd = cast(Any, None)
     yf = cast(Any, None)
     _IMPORT_ERROR = str(exc)
 
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - optional transport
+    pa = cast(Any, None)
+
 
 def _to_iso(value: Any) -> Any:
     if isinstance(value, pd.Timestamp):
@@ -25,64 +39,274 @@ def _to_iso(value: Any) -> Any:
     return value
 
 
-def _serialize_value(value: Any) -> Any:
-    if isinstance(value, pd.DataFrame):
-        df = value.copy()
-        df = df.where(pd.notnull(df), None)
-        return {
-            "__type__": "dataframe",
-            "columns": [str(c) for c in df.columns],
-            "index": [_to_iso(i) for i in df.index.tolist()],
-            "data": [[_serialize_value(v) for v in row] for row in df.to_numpy().tolist()],
-        }
+def _index_labels(index: Any) -> List[Any]:
+    # orjson writes datetimes via isoformat(); NaT goes through _json_default.
+    if isinstance(index, pd.DatetimeIndex):
+        return index.to_pydatetime().tolist()
+    if isinstance(index, pd.PeriodIndex):
+        return index.astype(str).tolist()
+    return index.tolist()
+
+
+def _column_labels(columns: Any) -> List[str]:
+    return list(map(str, columns))
+
+
+# main() points sys.stdout at stderr so that yfinance's prints cannot corrupt responses.
+_OUT_FD = 1
+_WRITE_BUFFER_BYTES = 1 << 20
+
+_STREAM_CHUNK_ROWS = 1000
+_ARROW_MIN_ROWS = 1000
+_CATEGORY_MIN_ROWS = 50
+_CATEGORY_MAX_RATIO = 0.3
+
+
+def _column_values(column: Any) -> List[Any]:
+    # Datetimes keep their offset, as in _index_labels.
+    if isinstance(column.dtype, pd.DatetimeTZDtype) or column.dtype.kind == "M":
+        return _index_labels(pd.DatetimeIndex(column))
+    if isinstance(column.dtype, np.dtype) and column.dtype.kind in "biuf":
+        return column.to_numpy().tolist()
+    return _object_values(column.tolist(), column)
+
+
+# infer_dtype results whose values orjson (with _json_default) encodes as-is.
+_PLAIN_INFERRED = frozenset({"string", "integer", "floating", "mixed-integer-float", "boolean", "datetime", "date", "empty"})
+
+
+def _object_values(items: List[Any], values: Any) -> List[Any]:
+    # infer_dtype scans in C, so only genuinely mixed data pays for the walk.
+    if pd.api.types.infer_dtype(values, skipna=True) in _PLAIN_INFERRED:
+        return items
+    return [v if type(v) in _SCALAR_TYPES else _serialize_value(v) for v in items]
+
+
+def _frame_values(value: Any) -> Any:
     if isinstance(value, pd.Series):
-        series = value.where(pd.notnull(value), None)
-        return {
-            "__type__": "series",
-            "name": str(series.name) if series.name is not None else None,
-            "index": [_to_iso(i) for i in series.index.tolist()],
-            "data": [_serialize_value(v) for v in series.tolist()],
-        }
+        return _column_values(value)
+    if value.shape[1] == 0:
+        return [[] for _ in range(len(value))]
+    columns = [_column_values(value.iloc[:, pos]) for pos in range(value.shape[1])]
+    return list(map(list, zip(*columns)))
+
+
+def _categorize(df: Any) -> Tuple[Any, Dict[str, List[Any]]]:
+    categories: Dict[str, List[Any]] = {}
+    if len(df) < _CATEGORY_MIN_ROWS:
+        return df, categories
+    encoded = df
+    for pos in range(df.shape[1]):
+        column = df.iloc[:, pos]
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            codes, uniques = column.cat.codes.to_numpy(), column.cat.categories
+        elif pd.api.types.is_string_dtype(column):
+            codes, uniques = pd.factorize(column)
+            if len(uniques) > len(column) * _CATEGORY_MAX_RATIO:
+                continue
+        else:
+            continue
+        if encoded is df:
+            encoded = df.copy(deep=False)
+        encoded.isetitem(pos, codes)
+        categories[str(pos)] = uniques.tolist()
+    return encoded, categories
+
+
+# Leaf types orjson writes as-is; container walkers skip the dispatch call for them.
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+@singledispatch
+def _serialize_value(value: Any) -> Any:
+    # Mapping-like objects such as FastInfo expose keys() without being dicts.
     if hasattr(value, "keys") and hasattr(value, "__getitem__"):
         try:
             return {str(k): _serialize_value(value[k]) for k in value.keys()}
         except Exception:
             pass
-    if isinstance(value, (np.generic,)):
-        val = value.item()
-        if isinstance(val, float) and math.isnan(val):
-            return None
-        return val
-    if isinstance(value, (np.ndarray,)):
-        return [_serialize_value(v) for v in value.tolist()]
-    if isinstance(value, (dict,)):
-        return {str(k): _serialize_value(v) for k, v in value.items()}
-    if isinstance(value, (list, tuple)):
-        return [_serialize_value(v) for v in value]
+    return value
+
+
+def _serialize_frame(value: Any) -> Any:
+    encoded, categories = _categorize(value)
+    frame = {
+        "__type__": "dataframe",
+        "columns": _column_labels(value.columns),
+        "index": _index_labels(value.index),
+        "data": _frame_values(encoded),
+    }
+    if categories:
+        frame["categories"] = categories
+    return frame
+
+
+def _serialize_series(value: Any) -> Any:
+    return {
+        "__type__": "series",
+        "name": str(value.name) if value.name is not None else None,
+        "index": _index_labels(value.index),
+        "data": _frame_values(value),
+    }
+
+
+def _serialize_array(value: Any) -> Any:
+    if value.dtype.kind == "O":
+        return _object_values(value.tolist(), value.ravel())
+    if value.dtype.kind == "M":
+        # orjson rejects NaT.
+        return value.astype("datetime64[us]").tolist()
+    if value.dtype.isnative and (value.dtype.kind in "biu" or value.dtype in (np.float32, np.float64)):
+        # orjson reads these from the buffer, but only C-contiguous native-endian ones.
+        return np.ascontiguousarray(value)
+    return value.tolist()
+
+
+@_serialize_value.register(dict)
+def _serialize_dict(value: Dict[Any, Any]) -> Any:
+    return {str(k): v if type(v) in _SCALAR_TYPES else _serialize_value(v) for k, v in value.items()}
+
+
+@_serialize_value.register(list)
+@_serialize_value.register(tuple)
+def _serialize_sequence(value: Any) -> Any:
+    return [v if type(v) in _SCALAR_TYPES else _serialize_value(v) for v in value]
+
+
+@_serialize_value.register(str)
+@_serialize_value.register(int)
+@_serialize_value.register(float)
+@_serialize_value.register(type(None))
+def _serialize_passthrough(value: Any) -> Any:
+    return value
+
+
+def _serialize_generic(value: Any) -> Any:
+    # orjson raises on NaT and has no float16/longdouble encoder.
+    if isinstance(value, np.datetime64):
+        return value.astype("datetime64[us]").item()
+    if value.dtype.kind in "biu" or value.dtype in (np.float32, np.float64):
+        return value
+    if value.dtype.kind == "f":
+        return float(value)
+    if value.dtype.kind == "c":
+        raise TypeError(f"Cannot serialize complex value {value!r}")
+    return value.item()
+
+
+if _IMPORT_ERROR is None:
+    _serialize_value.register(pd.DataFrame, _serialize_frame)
+    _serialize_value.register(pd.Series, _serialize_series)
+    _serialize_value.register(np.ndarray, _serialize_array)
+    _serialize_value.register(np.generic, _serialize_generic)
+    _serialize_value.register(pd.Timestamp, _serialize_passthrough)
+
+
+def _json_default(value: Any) -> Any:
+    if value is pd.NaT or value is pd.NA:
+        return None
     if isinstance(value, (pd.Timestamp, pd.Period)):
         return _to_iso(value)
-    if isinstance(value, float) and math.isnan(value):
-        return None
-    return value
+    if isinstance(value, np.generic):
+        return _serialize_generic(value)
+    raise TypeError
+
+
+_DUMPS_OPTION = 0
+if orjson is not None:
+    _DUMPS_OPTION = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
 
 
-def _read_payload() -> Dict[str, Any]:
-    raw = sys.stdin.read()
-    if not raw.strip():
-        return {}
-    return json.loads(raw)
+def _write(data: Any) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(_OUT_FD, view):]
 
 
-def _ok(result: Any) -> None:
+def _dumps(value: Any) -> bytes:
+    return orjson.dumps(value, default=_json_default, option=_DUMPS_OPTION)
+
+
+def _ok_frame(df: Any) -> None:
+    chunks = -(-len(df) // _STREAM_CHUNK_ROWS)
+    encoded, categories = _categorize(df)
+    header = {
+        "ok": True,
+        "result": {
+            "__type__": "dataframe_ndjson",
+            "columns": _column_labels(df.columns),
+            "chunks": chunks,
+        },
+    }
+    if categories:
+        header["result"]["categories"] = categories
+    pending = bytearray(_dumps(header) + b"\n")
+    for start in range(0, chunks * _STREAM_CHUNK_ROWS, _STREAM_CHUNK_ROWS):
+        part = encoded.iloc[start:start + _STREAM_CHUNK_ROWS]
+        index = _dumps(_index_labels(part.index))
+        pending += b'{"index":' + index + b',"data":' + _dumps(_frame_values(part)) + b"}\n"
+        if len(pending) >= _WRITE_BUFFER_BYTES:
+            _write(pending)
+            pending.clear()
+    _write(pending)
+
+
+def _iso_array(labels: List[Any]) -> Any:
+    # The JSON path's strings, so the decoded frame does not depend on the transport.
+    return pa.array(orjson.loads(_dumps(labels)), pa.string())
+
+
+def _frame_arrow(df: Any) -> Any:
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for pos, field in enumerate(table.schema):
+        if pa.types.is_temporal(field.type):
+            table = table.set_column(pos, field.name, _iso_array(_column_values(df.iloc[:, pos])))
+    index = pa.array(df.index)
+    if pa.types.is_temporal(index.type):
+        index = _iso_array(_index_labels(df.index))
+    table = table.add_column(0, "__index__", index)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def _ok_arrow(df: Any) -> bool:
+    if pa is None or len(df) < _ARROW_MIN_ROWS:
+        return False
+    try:
+        body = _frame_arrow(df)
+    except (pa.ArrowException, TypeError, ValueError):
+        return False
+    header = {
+        "ok": True,
+        "result": {
+            "__type__": "dataframe_arrow",
+            "columns": _column_labels(df.columns),
+            "length": body.size,
+        },
+    }
+    _write(_dumps(header) + b"\n")
+    _write(body)
+    _write(b"\n")
+    return True
+
+
+def _ok(result: Any, fmt: str = "json") -> None:
+    if isinstance(result, pd.DataFrame):
+        if fmt == "arrow" and _ok_arrow(result):
+            return
+        _ok_frame(result)
+        return
     payload = {"ok": True, "result": _serialize_value(result)}
-    sys.stdout.write(json.dumps(payload, ensure_ascii=False, allow_nan=False))
+    _write(_dumps(payload) + b"\n")
 
 
 def _err(message: str, details: Optional[str] = None) -> None:
     payload = {"ok": False, "error": message}
     if details:
         payload["details"] = details
-    sys.stdout.write(json.dumps(payload, ensure_ascii=False))
+    _write(orjson.dumps(payload) + b"\n")
 
 
 def _build_query(query_type: str, query_payload: Dict[str, Any]):
@@ -93,19 +317,87 @@ def _build_query(query_type: str, query_payload: Dict[str, Any]):
     else:
         raise ValueError("query_type must be 'equity' or 'fund'")
 
-    operator = query_payload.get("operator")
-    operands = query_payload.get("operands")
-    if not operator or operands is None:
-        raise ValueError("Query must include operator and operands")
+    # Post-order walk with an explicit stack; identical sub-queries share one instance.
+    built: Dict[int, Any] = {}
+    by_content: Dict[Any, Any] = {}
+    stack = [(query_payload, False)]
+    while stack:
+        node, children_built = stack.pop()
+        operands = node.get("operands")
+        if not children_built:
+            if not node.get("operator") or operands is None:
+                raise ValueError("Query must include operator and operands")
+            stack.append((node, True))
+            stack.extend((operand, False) for operand in operands if _is_query(operand))
+            continue
+
+        parsed_operands = [built[id(operand)] if _is_query(operand) else operand for operand in operands]
+        key = (
+            _operand_key(node["operator"]),
+            # A bare id cannot collide with the (type, value) operand keys.
+            tuple(
+                id(parsed) if _is_query(operand) else _operand_key(operand)
+                for operand, parsed in zip(operands, parsed_operands)
+            ),
+        )
+        query = by_content.get(key)
+        if query is None:
+            query = by_content[key] = query_cls(node["operator"], parsed_operands)
+        built[id(node)] = query
 
-    parsed_operands = []
-    for operand in operands:
-        if isinstance(operand, dict) and "operator" in operand:
-            parsed_operands.append(_build_query(query_type, operand))
-        else:
-            parsed_operands.append(operand)
+    return built[id(query_payload)]
+
+
+def _is_query(operand: Any) -> bool:
+    return isinstance(operand, dict) and "operator" in operand
+
+
+def _operand_key(operand: Any) -> Any:
+    # Tagged with the type so that 1, 1.0 and True (equal in Python) stay apart.
+    if isinstance(operand, list):
+        return (list, tuple(map(_operand_key, operand)))
+    if isinstance(operand, dict):
+        return (dict, tuple(sorted((k, _operand_key(v)) for k, v in operand.items())))
+    return (type(operand), operand)
+
+
+_TICKERS_MAX_WORKERS = 16
 
-    return query_cls(operator, parsed_operands)
+_CACHE_LOCK = threading.Lock()
+_TICKER_CACHE: "OrderedDict[str, Any]" = OrderedDict()
+_TICKER_CACHE_SIZE = 128
+_TICKER_TTL_SECONDS = 900
+
+_ATTR_CACHE: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+_ATTR_CACHE_SIZE = 128
+# Quote data moves during the session; other attributes share the Ticker lifetime.
+_ATTR_TTL_SECONDS = {"info": 300, "fast_info": 60}
+
+
+def _cached(cache: "OrderedDict[Any, Any]", key: Any, ttl: float, size: int, producer: Callable[[], Any]) -> Any:
+    now = time.monotonic()
+    with _CACHE_LOCK:
+        hit = cache.get(key)
+        if hit is not None and now - hit[0] < ttl:
+            cache.move_to_end(key)
+            return hit[1]
+    value = producer()
+    with _CACHE_LOCK:
+        cache[key] = (now, value)
+        cache.move_to_end(key)
+        if len(cache) > size:
+            cache.popitem(last=False)
+    return value
+
+
+def _ticker(symbol: str):
+    # No session: yfinance shares one curl_cffi session process-wide and rejects requests_cache.
+    return _cached(_TICKER_CACHE, symbol.upper(), _TICKER_TTL_SECONDS, _TICKER_CACHE_SIZE, lambda: yf.Ticker(symbol))
+
+
+def _pop_kwargs(args: Dict[str, Any], *reserved: str) -> Dict[str, Any]:
+    skip = frozenset(reserved)
+    return {k: v for k, v in args.items() if v is not None and k not in skip}
 
 
 def _handle_download(args: Dict[str, Any]):
@@ -113,7 +405,7 @@ def _handle_download(args: Dict[str, Any]):
     if not tickers:
         raise ValueError("tickers is required")
 
-    kwargs = {k: v for k, v in args.items() if k != "tickers" and v is not None}
+    kwargs = _pop_kwargs(args, "tickers")
     return yf.download(tickers, **kwargs)
 
 
@@ -121,9 +413,9 @@ def _handle_ticker(args: Dict[str, Any], fn_name: str):
     ticker = args.get("ticker")
     if not ticker:
         raise ValueError("ticker is required")
-    tkr = yf.Ticker(ticker)
+    tkr = _ticker(ticker)
     fn = getattr(tkr, fn_name)
-    kwargs = {k: v for k, v in args.items() if k != "ticker" and v is not None}
+    kwargs = _pop_kwargs(args, "ticker")
     return fn(**kwargs)
 
 
@@ -131,25 +423,41 @@ def _handle_tickers(args: Dict[str, Any], fn_name: str):
     tickers = args.get("tickers")
     if not tickers:
         raise ValueError("tickers is required")
-    tks = yf.Tickers(tickers)
-    fn = getattr(tks, fn_name)
-    kwargs = {k: v for k, v in args.items() if k != "tickers" and v is not None}
-    return fn(**kwargs)
+    kwargs = _pop_kwargs(args, "tickers")
+    if fn_name == "history":
+        # yf.Tickers.history batches through yf.download, which already threads.
+        tks = yf.Tickers(tickers)
+        return tks.history(**kwargs)
+
+    symbols = tickers if isinstance(tickers, list) else tickers.replace(",", " ").split()
+    symbols = [symbol.upper() for symbol in symbols]
+    if not symbols:
+        raise ValueError("tickers is required")
+
+    def fetch(symbol: str):
+        value = getattr(_ticker(symbol), fn_name)
+        return value(**kwargs) if callable(value) else value
+
+    # Per-ticker fetches are network-bound; yfinance shares one session across threads.
+    with ThreadPoolExecutor(max_workers=min(_TICKERS_MAX_WORKERS, len(symbols))) as pool:
+        return dict(zip(symbols, pool.map(fetch, symbols)))
 
 
 def _handle_ticker_attr(args: Dict[str, Any], attr_name: str):
     ticker = args.get("ticker")
     if not ticker:
         raise ValueError("ticker is required")
-    tkr = yf.Ticker(ticker)
-    return getattr(tkr, attr_name)
+    ttl = _ATTR_TTL_SECONDS.get(attr_name, _TICKER_TTL_SECONDS)
+    key = (ticker.upper(), attr_name)
+    # A fresh Ticker on a miss, so a cached Ticker's memoized copy cannot outlive the TTL.
+    return _cached(_ATTR_CACHE, key, ttl, _ATTR_CACHE_SIZE, lambda: getattr(yf.Ticker(ticker), attr_name))
 
 
 def _handle_options(args: Dict[str, Any]):
     ticker = args.get("ticker")
     if not ticker:
         raise ValueError("ticker is required")
-    tkr = yf.Ticker(ticker)
+    tkr = _ticker(ticker)
     date = args.get("date")
     tz = args.get("tz")
     chain = tkr.option_chain(date=date, tz=tz)
@@ -313,6 +621,8 @@ def _handle_screen(args: Dict[str, Any]):
     return yf.screen(query, **kwargs)
 
 
+# Both field handlers return process-lifetime constants, so they are built once.
+@lru_cache(maxsize=1)
 def _handle_field_definitions() -> Dict[str, Any]:
     from yfinance import const
     from yfinance.scrapers.quote import FastInfo
@@ -324,10 +634,11 @@ def _handle_field_definitions() -> Dict[str, Any]:
         "fund_screener_fields": const.FUND_SCREENER_FIELDS,
         "equity_screener_eq_map": const.EQUITY_SCREENER_EQ_MAP,
         "fund_screener_eq_map": const.FUND_SCREENER_EQ_MAP,
-        "fast_info_keys": FastInfo(yf.Ticker("SPY")).keys(),
+        "fast_info_keys": FastInfo(_ticker("SPY")).keys(),
     }
 
 
+@lru_cache(maxsize=1)
 def _handle_field_categories() -> Dict[str, Any]:
     from yfinance import const
     return {
@@ -338,137 +649,207 @@ def _handle_field_categories() -> Dict[str, Any]:
     }
 
 
+_DISPATCH: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "download": _handle_download,
+
+    "ticker_history": partial(_handle_ticker, fn_name="history"),
+    "tickers_history": partial(_handle_tickers, fn_name="history"),
+    "tickers_news": partial(_handle_tickers, fn_name="news"),
+    "ticker_info": partial(_handle_ticker_attr, attr_name="info"),
+    "ticker_fast_info": partial(_handle_ticker_attr, attr_name="fast_info"),
+    "ticker_actions": partial(_handle_ticker_attr, attr_name="actions"),
+    "ticker_dividends": partial(_handle_ticker_attr, attr_name="dividends"),
+    "ticker_splits": partial(_handle_ticker_attr, attr_name="splits"),
+    "ticker_capital_gains": partial(_handle_ticker_attr, attr_name="capital_gains"),
+    "ticker_news": partial(_handle_ticker_attr, attr_name="news"),
+
+    "ticker_income_stmt": partial(_handle_ticker, fn_name="get_income_stmt"),
+    "ticker_balance_sheet": partial(_handle_ticker, fn_name="get_balance_sheet"),
+    "ticker_cash_flow": partial(_handle_ticker, fn_name="get_cash_flow"),
+    "ticker_earnings": partial(_handle_ticker_attr, attr_name="earnings"),
+    "ticker_calendar": partial(_handle_ticker_attr, attr_name="calendar"),
+    "ticker_earnings_dates": partial(_handle_ticker, fn_name="get_earnings_dates"),
+    "ticker_sec_filings": partial(_handle_ticker_attr, attr_name="sec_filings"),
+    "ticker_shares": partial(_handle_ticker, fn_name="get_shares"),
+    "ticker_shares_full": partial(_handle_ticker, fn_name="get_shares_full"),
+
+    "ticker_recommendations": partial(_handle_ticker, fn_name="get_recommendations"),
+    "ticker_recommendations_summary": partial(_handle_ticker, fn_name="get_recommendations_summary"),
+    "ticker_upgrades_downgrades": partial(_handle_ticker, fn_name="get_upgrades_downgrades"),
+    "ticker_sustainability": partial(_handle_ticker, fn_name="get_sustainability"),
+    "ticker_analyst_price_targets": partial(_handle_ticker, fn_name="get_analyst_price_targets"),
+    "ticker_earnings_estimate": partial(_handle_ticker, fn_name="get_earnings_estimate"),
+    "ticker_revenue_estimate": partial(_handle_ticker, fn_name="get_revenue_estimate"),
+    "ticker_earnings_history": partial(_handle_ticker, fn_name="get_earnings_history"),
+    "ticker_eps_trend": partial(_handle_ticker, fn_name="get_eps_trend"),
+    "ticker_eps_revisions": partial(_handle_ticker, fn_name="get_eps_revisions"),
+    "ticker_growth_estimates": partial(_handle_ticker, fn_name="get_growth_estimates"),
+
+    "ticker_major_holders": partial(_handle_ticker, fn_name="get_major_holders"),
+    "ticker_institutional_holders": partial(_handle_ticker, fn_name="get_institutional_holders"),
+    "ticker_mutualfund_holders": partial(_handle_ticker, fn_name="get_mutualfund_holders"),
+    "ticker_insider_purchases": partial(_handle_ticker, fn_name="get_insider_purchases"),
+    "ticker_insider_transactions": partial(_handle_ticker, fn_name="get_insider_transactions"),
+    "ticker_insider_roster_holders": partial(_handle_ticker, fn_name="get_insider_roster_holders"),
+    "ticker_funds_data": partial(_handle_ticker_attr, attr_name="funds_data"),
+
+    "ticker_options": _handle_options,
+
+    "search": _handle_search,
+    "lookup": _handle_lookup,
+    "market": _handle_market,
+    "sector": _handle_sector,
+    "industry": _handle_industry,
+    "calendars": _handle_calendars,
+    "screen": _handle_screen,
+
+    "field_definitions": lambda _args: _handle_field_definitions(),
+    "field_categories": lambda _args: _handle_field_categories(),
+}
+
+
 def _dispatch(action: str, args: Dict[str, Any]):
-    if action == "download":
-        return _handle_download(args)
-
-    if action == "ticker_history":
-        return _handle_ticker(args, "history")
-    if action == "tickers_history":
-        return _handle_tickers(args, "history")
-    if action == "tickers_news":
-        return _handle_tickers(args, "news")
-    if action == "ticker_info":
-        return _handle_ticker_attr(args, "info")
-    if action == "ticker_fast_info":
-        return _handle_ticker_attr(args, "fast_info")
-    if action == "ticker_actions":
-        return _handle_ticker_attr(args, "actions")
-    if action == "ticker_dividends":
-        return _handle_ticker_attr(args, "dividends")
-    if action == "ticker_splits":
-        return _handle_ticker_attr(args, "splits")
-    if action == "ticker_capital_gains":
-        return _handle_ticker_attr(args, "capital_gains")
-    if action == "ticker_news":
-        return _handle_ticker_attr(args, "news")
-
-    if action == "ticker_income_stmt":
-        return _handle_ticker(args, "get_income_stmt")
-    if action == "ticker_balance_sheet":
-        return _handle_ticker(args, "get_balance_sheet")
-    if action == "ticker_cash_flow":
-        return _handle_ticker(args, "get_cash_flow")
-    if action == "ticker_earnings":
-        return _handle_ticker_attr(args, "earnings")
-    if action == "ticker_calendar":
-        return _handle_ticker_attr(args, "calendar")
-    if action == "ticker_earnings_dates":
-        return _handle_ticker(args, "get_earnings_dates")
-    if action == "ticker_sec_filings":
-        return _handle_ticker_attr(args, "sec_filings")
-    if action == "ticker_shares":
-        return _handle_ticker(args, "get_shares")
-    if action == "ticker_shares_full":
-        return _handle_ticker(args, "get_shares_full")
-
-    if action == "ticker_recommendations":
-        return _handle_ticker(args, "get_recommendations")
-    if action == "ticker_recommendations_summary":
-        return _handle_ticker(args, "get_recommendations_summary")
-    if action == "ticker_upgrades_downgrades":
-        return _handle_ticker(args, "get_upgrades_downgrades")
-    if action == "ticker_sustainability":
-        return _handle_ticker(args, "get_sustainability")
-    if action == "ticker_analyst_price_targets":
-        return _handle_ticker(args, "get_analyst_price_targets")
-    if action == "ticker_earnings_estimate":
-        return _handle_ticker(args, "get_earnings_estimate")
-    if action == "ticker_revenue_estimate":
-        return _handle_ticker(args, "get_revenue_estimate")
-    if action == "ticker_earnings_history":
-        return _handle_ticker(args, "get_earnings_history")
-    if action == "ticker_eps_trend":
-        return _handle_ticker(args, "get_eps_trend")
-    if action == "ticker_eps_revisions":
-        return _handle_ticker(args, "get_eps_revisions")
-    if action == "ticker_growth_estimates":
-        return _handle_ticker(args, "get_growth_estimates")
-
-    if action == "ticker_major_holders":
-        return _handle_ticker(args, "get_major_holders")
-    if action == "ticker_institutional_holders":
-        return _handle_ticker(args, "get_institutional_holders")
-    if action == "ticker_mutualfund_holders":
-        return _handle_ticker(args, "get_mutualfund_holders")
-    if action == "ticker_insider_purchases":
-        return _handle_ticker(args, "get_insider_purchases")
-    if action == "ticker_insider_transactions":
-        return _handle_ticker(args, "get_insider_transactions")
-    if action == "ticker_insider_roster_holders":
-        return _handle_ticker(args, "get_insider_roster_holders")
-    if action == "ticker_funds_data":
-        return _handle_ticker_attr(args, "funds_data")
-
-    if action == "ticker_options":
-        return _handle_options(args)
-
-    if action == "search":
-        return _handle_search(args)
-    if action == "lookup":
-        return _handle_lookup(args)
-    if action == "market":
-        return _handle_market(args)
-    if action == "sector":
-        return _handle_sector(args)
-    if action == "industry":
-        return _handle_industry(args)
-    if action == "calendars":
-        return _handle_calendars(args)
-    if action == "screen":
-        return _handle_screen(args)
-
-    if action == "field_definitions":
-        return _handle_field_definitions()
-    if action == "field_categories":
-        return _handle_field_categories()
-
-    raise ValueError(f"Unknown action '{action}'")
+    handler = _DISPATCH.get(action)
+    if handler is None:
+        raise ValueError(f"Unknown action '{action}'")
+    return handler(args)
+
+
+# Fundamentals change at most quarterly; FINMCP_CACHE_TTL=0 disables the disk cache.
+_DISK_CACHE_ACTIONS = frozenset({
+    "ticker_income_stmt",
+    "ticker_balance_sheet",
+    "ticker_cash_flow",
+    "ticker_sec_filings",
+    "ticker_shares",
+    "sector",
+    "industry",
+})
+_DISK_CACHE_DIR = os.environ.get("FINMCP_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "finmcp")
+_DISK_CACHE_DEFAULT_TTL = 90 * 24 * 3600
+
+
+def _env_seconds(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
 
 
-def main() -> None:
-    if _IMPORT_ERROR:
-        _err(
-            "Missing Python dependencies for yfinance bridge.",
-            "Install with: pip install -r mcp/python/requirements.txt",
-        )
-        return
+_DISK_CACHE_TTL = _env_seconds("FINMCP_CACHE_TTL", _DISK_CACHE_DEFAULT_TTL)
 
-    payload = _read_payload()
-    action = payload.get("action")
-    args = payload.get("args", {})
 
-    if not action:
-        _err("Missing action in payload")
-        return
+def _is_empty(result: Any) -> bool:
+    # Failed fetches come back empty or, for Sector/Industry, with only "key" set.
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        return result.empty
+    if isinstance(result, dict):
+        return all(_is_empty(v) for k, v in result.items() if k != "key")
+    return result is None or (isinstance(result, (list, tuple)) and not result)
+
+
+def _disk_cache(action: str, args: Dict[str, Any], producer: Callable[[], Any]) -> Any:
+    if _DISK_CACHE_TTL <= 0:
+        return producer()
+    key = hashlib.md5(orjson.dumps([action, args], option=orjson.OPT_SORT_KEYS)).hexdigest()
+    path = os.path.join(_DISK_CACHE_DIR, action, f"{key}.json")
+    try:
+        with open(path, "rb") as fh:
+            entry = orjson.loads(fh.read())
+        if time.time() - entry["ts"] < _DISK_CACHE_TTL:
+            return entry["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    result = producer()
+    data = _serialize_value(result)
+    if _is_empty(result):
+        return data
+    try:
+        entry = _dumps({"ts": time.time(), "data": data})
+    except TypeError:
+        # Not encodable (a whole sector dict holds a yf.Ticker); _ok reports it.
+        return data
+    tmp_path = None
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write-then-rename so concurrent bridges never read a partial entry.
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(entry)
+        os.replace(tmp_path, path)
+    except OSError:
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+    return data
 
+
+class _Request(NamedTuple):
+    action: str
+    args: Dict[str, Any]
+    format: str
+
+
+_FORMATS = frozenset({"json", "arrow"})
+
+
+def _parse_request(line: bytes) -> _Request:
+    try:
+        payload = orjson.loads(line)
+    except orjson.JSONDecodeError as exc:
+        raise ValueError(f"Invalid JSON payload: {exc}") from None
+    if not isinstance(payload, dict):
+        raise ValueError("Payload must be a JSON object")
+    action = payload.get("action")
+    if not action or not isinstance(action, str):
+        raise ValueError("Missing action in payload")
+    args = payload.get("args") or {}
+    if not isinstance(args, dict):
+        raise ValueError("args must be a JSON object")
+    fmt = payload.get("format", "json")
+    if fmt not in _FORMATS:
+        raise ValueError("format must be one of: json, arrow")
+    return _Request(action, args, fmt)
+
+
+def _handle_request(request: _Request) -> None:
+    action, args = request.action, request.args
     try:
-        result = _dispatch(action, args)
-        _ok(result)
+        if action in _DISK_CACHE_ACTIONS:
+            result = _disk_cache(action, args, lambda: _dispatch(action, args))
+        else:
+            result = _dispatch(action, args)
+        _ok(result, request.format)
     except Exception as exc:
         detail = traceback.format_exc()
         _err(str(exc), detail)
 
 
+def main() -> None:
+    sys.stdout = sys.stderr
+    if _IMPORT_ERROR:
+        # orjson may be the missing module, so this response uses the stdlib encoder.
+        import_error = json.dumps({
+            "ok": False,
+            "error": "Missing Python dependencies for yfinance bridge.",
+            "details": "Install with: pip install -r mcp/python/requirements.txt",
+        }).encode() + b"\n"
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+        if _IMPORT_ERROR:
+            _write(import_error)
+        else:
+            try:
+                request = _parse_request(line)
+            except ValueError as exc:
+                _err(str(exc))
+            else:
+                _handle_request(request)
+
+
 if __name__ == "__main__":
     main()
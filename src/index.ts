@@ -2,7 +2,8 @@
 import { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js";
 import { StdioServerTransport } from "@modelcontextprotocol/sdk/server/stdio.js";
 import { z } from "zod";
-import { spawn } from "node:child_process";
+import { spawn, type ChildProcessWithoutNullStreams } from "node:child_process";
+import type { Socket } from "node:net";
 import { fileURLToPath } from "node:url";
 import path from "node:path";
 import fs from "node:fs/promises";
@@ -12,6 +13,9 @@ const __dirname = path.dirname(__filename);
 
 const PYTHON_BRIDGE = path.resolve(__dirname, "..", "python", "yf_bridge.py");
 const SERVER_NAME = "finmcp";
+// A call past the timeout gets its bridge process killed so the calls queued behind it can move on.
+const BRIDGE_WORKERS = 4;
+const BRIDGE_TIMEOUT_MS = 120_000;
 
 const responseFormatSchema = z.enum(["json", "markdown"]).default("json");
 const saveSchema = z
@@ -40,50 +44,310 @@ function extractPreviewLimit(options?: OutputOptions): number {
   return options?.preview_limit ?? 25;
 }
 
-async function callBridge<T>(action: string, args: Record<string, unknown>): Promise<T> {
-  const payload = JSON.stringify({ action, args });
+type BridgeResponse = {
+  ok: boolean;
+  result?: unknown;
+  error?: string;
+  details?: string;
+};
+
+type DataFrameChunk = {
+  index: unknown[];
+  data: unknown[][];
+};
+
+type ArrowVector = { get(index: number): unknown };
+
+type ArrowTable = {
+  numRows: number;
+  schema: { fields: unknown[] };
+  getChildAt(index: number): ArrowVector | null;
+};
+
+type ArrowModule = {
+  tableFromIPC(input: Uint8Array): ArrowTable;
+};
+
+// apache-arrow is optional: large tables come back as Arrow IPC only when it is installed.
+const ARROW_MODULE: string = "apache-arrow";
+let arrowModule: Promise<ArrowModule | null> | undefined;
+
+function loadArrow(): Promise<ArrowModule | null> {
+  arrowModule ??= import(ARROW_MODULE).then(
+    (mod) => mod as ArrowModule,
+    () => null,
+  );
+  return arrowModule;
+}
 
-  return new Promise<T>((resolve, reject) => {
-    const proc = spawn(pythonCommand(), [PYTHON_BRIDGE], {
-      stdio: ["pipe", "pipe", "pipe"],
-    });
+function isStreamedDataFrame(value: unknown): value is {
+  __type__: "dataframe_ndjson";
+  columns: string[];
+  chunks: number;
+  categories?: Record<string, unknown[]>;
+} {
+  return typeof value === "object" && value !== null && (value as { __type__?: string }).__type__ === "dataframe_ndjson";
+}
+
+function isArrowDataFrame(value: unknown): value is { __type__: "dataframe_arrow"; columns: string[]; length: number } {
+  return typeof value === "object" && value !== null && (value as { __type__?: string }).__type__ === "dataframe_arrow";
+}
+
+function arrowCell(value: unknown): unknown {
+  return typeof value === "bigint" ? Number(value) : value;
+}
+
+function decodeArrowFrame(arrow: ArrowModule, columns: string[], bytes: Uint8Array) {
+  const table = arrow.tableFromIPC(bytes);
+  const vectors = table.schema.fields.map((_, idx) => table.getChildAt(idx));
+  const index: unknown[] = [];
+  const data: unknown[][] = [];
+  for (let row = 0; row < table.numRows; row++) {
+    index.push(arrowCell(vectors[0]?.get(row)));
+    data.push(columns.map((_, col) => arrowCell(vectors[col + 1]?.get(row))));
+  }
+  return { __type__: "dataframe", columns, index, data };
+}
+
+type DataFrame = {
+  __type__: "dataframe";
+  columns: string[];
+  index: unknown[];
+  data: unknown[][];
+  categories?: Record<string, unknown[]>;
+};
+
+type PendingCall = {
+  action: string;
+  payload: string;
+  resolve: (value: unknown) => void;
+  reject: (err: Error) => void;
+};
+
+// A response whose header line has been read and whose body is still arriving.
+type PartialResponse =
+  | { kind: "frame"; frame: DataFrame; remaining: number }
+  | { kind: "arrow"; columns: string[]; length: number; parts: Buffer[]; received: number };
+
+type BridgeWorker = {
+  proc: ChildProcessWithoutNullStreams;
+  arrow: ArrowModule | null;
+  pending: PendingCall[];
+  timer?: NodeJS.Timeout;
+  partial: Buffer[];
+  current?: PartialResponse;
+  stderr: string;
+};
+
+let workers: BridgeWorker[] = [];
+
+function expandCategories(frame: DataFrame) {
+  if (!frame.categories) {
+    return;
+  }
+  for (const [position, values] of Object.entries(frame.categories)) {
+    const col = Number(position);
+    for (const row of frame.data) {
+      const code = row[col];
+      row[col] = typeof code === "number" && code >= 0 ? values[code] : null;
+    }
+  }
+  delete frame.categories;
+}
 
-    let stdout = "";
-    let stderr = "";
+function restoreFrames(value: unknown) {
+  if (Array.isArray(value)) {
+    value.forEach(restoreFrames);
+    return;
+  }
+  if (typeof value !== "object" || value === null) {
+    return;
+  }
+  if (isDataFrame(value)) {
+    expandCategories(value);
+    return;
+  }
+  Object.values(value).forEach(restoreFrames);
+}
 
-    proc.stdout.on("data", (chunk) => {
-      stdout += chunk.toString();
-    });
+function settle(state: BridgeWorker, response: BridgeResponse) {
+  state.current = undefined;
+  const call = state.pending.shift();
+  armTimeout(state);
+  if (!call) {
+    return;
+  }
+  if (!response.ok) {
+    const error = new Error(response.error || "Unknown error from bridge");
+    (error as Error & { details?: string }).details = response.details;
+    call.reject(error);
+    return;
+  }
+  restoreFrames(response.result);
+  call.resolve(response.result);
+}
 
-    proc.stderr.on("data", (chunk) => {
-      stderr += chunk.toString();
-    });
+// Bridge wire format: one JSON line per response. A top-level DataFrame is a
+// "dataframe_ndjson" header line ({columns, chunks, categories?}) followed by `chunks`
+// lines of {index, data} rows. With apache-arrow, large frames instead come as a
+// "dataframe_arrow" header ({columns, length}), then `length` bytes of Arrow IPC (column 0
+// is the index, dates are ISO strings), then a newline. In any frame, `categories` maps a
+// column position to the values its integer codes stand for, with -1 for a missing value.
+function handleLine(state: BridgeWorker, line: string) {
+  const message = JSON.parse(line) as BridgeResponse | DataFrameChunk;
+  const current = state.current;
+
+  if (current?.kind === "frame") {
+    if ("ok" in message) {
+      // The bridge reports errors raised mid-stream as a regular error line.
+      settle(state, message);
+      return;
+    }
+    current.frame.index.push(...message.index);
+    current.frame.data.push(...message.data);
+    current.remaining -= 1;
+    if (current.remaining === 0) {
+      settle(state, { ok: true, result: current.frame });
+    }
+    return;
+  }
 
-    proc.on("error", (err) => {
-      reject(err);
-    });
+  const response = message as BridgeResponse;
+  if (response.ok && isArrowDataFrame(response.result)) {
+    state.current = { kind: "arrow", columns: response.result.columns, length: response.result.length, parts: [], received: 0 };
+    return;
+  }
+  if (response.ok && isStreamedDataFrame(response.result)) {
+    const { columns, categories } = response.result;
+    const frame: DataFrame = { __type__: "dataframe", columns, index: [], data: [], categories };
+    if (response.result.chunks === 0) {
+      settle(state, { ok: true, result: frame });
+      return;
+    }
+    state.current = { kind: "frame", frame, remaining: response.result.chunks };
+    return;
+  }
+  settle(state, response);
+}
 
-    proc.on("close", (code) => {
-      if (code !== 0) {
-        reject(new Error(`Python bridge failed (${code}): ${stderr.trim()}`));
+// Only new chunks are searched for a newline; a line in progress is kept in `state.partial`.
+function readResponses(state: BridgeWorker, chunk: Buffer) {
+  let rest = chunk;
+  while (rest.length > 0) {
+    const current = state.current;
+    if (current?.kind === "arrow") {
+        const take = Math.min(current.length + 1 - current.received, rest.length);
+      current.parts.push(rest.subarray(0, take));
+      current.received += take;
+      rest = rest.subarray(take);
+      if (current.received <= current.length) {
         return;
       }
-      try {
-        const parsed = JSON.parse(stdout);
-        if (!parsed.ok) {
-          const error = new Error(parsed.error || "Unknown error from bridge");
-          (error as Error & { details?: string }).details = parsed.details;
-          reject(error);
-          return;
-        }
-        resolve(parsed.result as T);
-      } catch (err) {
-        reject(err);
+      if (!state.arrow) {
+        throw new Error("Python bridge sent Arrow data but apache-arrow is not installed");
       }
-    });
+      const body = Buffer.concat(current.parts).subarray(0, current.length);
+      settle(state, { ok: true, result: decodeArrowFrame(state.arrow, current.columns, body) });
+      continue;
+    }
 
-    proc.stdin.write(payload);
-    proc.stdin.end();
+    const newline = rest.indexOf(0x0a);
+    if (newline === -1) {
+      state.partial.push(rest);
+      return;
+    }
+    state.partial.push(rest.subarray(0, newline));
+    const line = Buffer.concat(state.partial).toString("utf8");
+    state.partial = [];
+    rest = rest.subarray(newline + 1);
+    if (line.trim().length > 0) {
+      handleLine(state, line);
+    }
+  }
+}
+
+function stopWorker(state: BridgeWorker, err: Error) {
+  workers = workers.filter((candidate) => candidate !== state);
+  clearTimeout(state.timer);
+  state.proc.kill();
+  for (const call of state.pending.splice(0)) {
+    call.reject(err);
+  }
+}
+
+function startWorker(arrow: ArrowModule | null): BridgeWorker {
+  const proc = spawn(pythonCommand(), [PYTHON_BRIDGE], {
+    stdio: ["pipe", "pipe", "pipe"],
+  });
+  const state: BridgeWorker = { proc, arrow, pending: [], partial: [], stderr: "" };
+
+  proc.stdout.on("data", (chunk: Buffer) => {
+    try {
+      readResponses(state, chunk);
+    } catch (err) {
+      stopWorker(state, err instanceof Error ? err : new Error(String(err)));
+    }
+  });
+
+  proc.stderr.on("data", (chunk) => {
+    state.stderr = (state.stderr + chunk.toString()).slice(-4096);
+  });
+
+  proc.stdin.on("error", (err) => {
+    stopWorker(state, err);
+  });
+
+  proc.on("error", (err) => {
+    stopWorker(state, err);
+  });
+
+  proc.on("close", (code) => {
+    stopWorker(state, new Error(`Python bridge failed (${code}): ${state.stderr.trim()}`));
+  });
+
+  // The worker must not keep the server alive once the MCP transport closes.
+  proc.unref();
+  for (const stream of [proc.stdin, proc.stdout, proc.stderr]) {
+    (stream as unknown as Socket).unref();
+  }
+  return state;
+}
+
+// Only the call at the head of a worker's queue is being served, so that is the one timed.
+function armTimeout(state: BridgeWorker) {
+  clearTimeout(state.timer);
+  state.timer = undefined;
+  if (state.pending.length === 0) {
+    return;
+  }
+  state.timer = setTimeout(() => {
+    const queued = state.pending.splice(1);
+    stopWorker(state, new Error(`Python bridge timed out after ${BRIDGE_TIMEOUT_MS / 1000}s on ${state.pending[0].action}`));
+    queued.forEach((call) => dispatchCall(call, state.arrow));
+  }, BRIDGE_TIMEOUT_MS);
+  state.timer.unref();
+}
+
+function dispatchCall(call: PendingCall, arrow: ArrowModule | null) {
+  let bridge = workers.find((candidate) => candidate.pending.length === 0);
+  if (!bridge && workers.length < BRIDGE_WORKERS) {
+    bridge = startWorker(arrow);
+    workers.push(bridge);
+  }
+  bridge ??= workers.reduce((best, candidate) => (candidate.pending.length < best.pending.length ? candidate : best));
+  bridge.pending.push(call);
+  if (bridge.pending.length === 1) {
+    armTimeout(bridge);
+  }
+  bridge.proc.stdin.write(`${call.payload}\n`);
+}
+
+async function callBridge<T>(action: string, args: Record<string, unknown>): Promise<T> {
+  const arrow = await loadArrow();
+  const payload = JSON.stringify({ action, args, format: arrow ? "arrow" : "json" });
+
+  return new Promise<T>((resolve, reject) => {
+    dispatchCall({ action, payload, resolve: (value) => resolve(value as T), reject }, arrow);
   });
 }
 
@@ -113,7 +377,7 @@ function stringifyJson(value: unknown): string {
   return JSON.stringify(value, null, 2);
 }
 
-function isDataFrame(value: unknown): value is { __type__: "dataframe"; columns: string[]; index: unknown[]; data: unknown[][] } {
+function isDataFrame(value: unknown): value is DataFrame {
   return typeof value === "object" && value !== null && (value as { __type__?: string }).__type__ === "dataframe";
 }
 